@@ -7,12 +7,19 @@ https://github.com/jdepoix/youtube-transcript-api#api
 from __future__ import annotations
 
 import argparse
+import asyncio
+import json
+import os
 import re
+import threading
+import time
 from pathlib import Path
-from typing import Iterable, List, Optional
-from urllib.parse import parse_qs, urlparse
+from typing import Iterable, List, NamedTuple, Optional
+from urllib.parse import unquote, urlparse
 
 from youtube_transcript_api import (
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
     NoTranscriptFound,
     TranscriptsDisabled,
     VideoUnavailable,
@@ -26,18 +33,175 @@ from youtube_transcript_api.formatters import (
     WebVTTFormatter,
 )
 
+try:  # Optional: google-re2 scans URLs in linear time.
+    import re2 as search_re
+except ImportError:
+    search_re = re
+
 VIDEO_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{11}")
+VIDEO_URL_MARKERS = ("watch?v=", "youtu.be/")
+VIDEO_ID_SEARCH_PATTERN = search_re.compile(r"[A-Za-z0-9_-]{11}")
+MAX_CONCURRENT_FETCHES = 10
+WRITE_BUFFER_SIZE = 64 * 1024
+JSONL_BUFFER_SIZE = 1 << 20
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "yttranscript"
+)
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+_thread_state = threading.local()
+# The formatters are stateless, so one shared instance per format is enough.
 FORMATTERS = {
-    "text": TextFormatter,
-    "pretty": PrettyPrintFormatter,
-    "json": JSONFormatter,
-    "srt": SRTFormatter,
-    "vtt": WebVTTFormatter,
+    "text": TextFormatter(),
+    "pretty": PrettyPrintFormatter(),
+    "json": JSONFormatter(),
+    "srt": SRTFormatter(),
+    "vtt": WebVTTFormatter(),
 }
 
 
+class CachedTranslationLanguage(NamedTuple):
+    language: str
+    language_code: str
+
+
+class CachedTranscript(NamedTuple):
+    """Metadata of a transcript as stored in the cache; it cannot be fetched."""
+
+    language: str
+    language_code: str
+    is_generated: bool
+    translation_languages: List[CachedTranslationLanguage]
+
+    @property
+    def is_translatable(self) -> bool:
+        return bool(self.translation_languages)
+
+
+class CachedTranscriptList:
+    """Read-only stand-in for TranscriptList built from cached metadata."""
+
+    def __init__(self, video_id: str, transcripts: List[CachedTranscript]):
+        self.video_id = video_id
+        self._transcripts = transcripts
+
+    def __iter__(self):
+        return iter(self._transcripts)
+
+    def find_transcript(self, language_codes: Iterable[str]) -> CachedTranscript:
+        # Same preference as TranscriptList: manually created before generated.
+        for code in language_codes:
+            for is_generated in (False, True):
+                for transcript in self._transcripts:
+                    if transcript.language_code == code and transcript.is_generated == is_generated:
+                        return transcript
+        raise NoTranscriptFound(self.video_id, language_codes, self)
+
+    def __str__(self) -> str:
+        return ", ".join(transcript.language_code for transcript in self._transcripts)
+
+
+class TranscriptCache:
+    """On-disk cache of transcript lists and fetched snippets, expired by file mtime."""
+
+    def __init__(self, directory: Path, ttl: float):
+        self.directory = directory
+        self.ttl = ttl
+
+    def load_transcript_list(self, video_id: str) -> Optional[CachedTranscriptList]:
+        data = self._read(self.directory / f"{video_id}.json")
+        if data is None:
+            return None
+        try:
+            transcripts = [
+                CachedTranscript(
+                    language=entry["language"],
+                    language_code=entry["language_code"],
+                    is_generated=entry["is_generated"],
+                    translation_languages=[
+                        CachedTranslationLanguage(**lang)
+                        for lang in entry["translation_languages"]
+                    ],
+                )
+                for entry in data
+            ]
+        except (KeyError, TypeError):
+            # Valid JSON with an unexpected shape (old schema, hand edit) is a miss.
+            return None
+        return CachedTranscriptList(video_id, transcripts)
+
+    def store_transcript_list(self, video_id: str, transcript_list) -> None:
+        data = [
+            {
+                "language": transcript.language,
+                "language_code": transcript.language_code,
+                "is_generated": transcript.is_generated,
+                "translation_languages": [
+                    {"language": lang.language, "language_code": lang.language_code}
+                    for lang in transcript.translation_languages
+                ],
+            }
+            for transcript in transcript_list
+        ]
+        self._write(self.directory / f"{video_id}.json", data)
+
+    def load_fetched(self, video_id: str, key: str) -> Optional[FetchedTranscript]:
+        data = self._read(self.directory / f"{video_id}.{key}.json")
+        if data is None:
+            return None
+        try:
+            return FetchedTranscript(
+                snippets=[FetchedTranscriptSnippet(**snippet) for snippet in data["snippets"]],
+                video_id=video_id,
+                language=data["language"],
+                language_code=data["language_code"],
+                is_generated=data["is_generated"],
+            )
+        except (KeyError, TypeError):
+            return None
+
+    def store_fetched(self, video_id: str, key: str, fetched: FetchedTranscript) -> None:
+        data = {
+            "language": fetched.language,
+            "language_code": fetched.language_code,
+            "is_generated": fetched.is_generated,
+            "snippets": fetched.to_raw_data(),
+        }
+        self._write(self.directory / f"{video_id}.{key}.json", data)
+
+    def _read(self, path: Path):
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path: Path, data) -> None:
+        # A failed cache write must never fail the download itself. Writing to a
+        # private temp file and renaming keeps readers from seeing a partial file.
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(json.dumps(data).encode("utf-8"))
+            os.replace(temp_path, path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+
+
 def extract_video_id(url: str) -> str:
-    """Extract the 11-character YouTube video id from a URL."""
+    """Extract the 11-character YouTube video id from a URL or a bare video id."""
+    if len(url) == 11 and VIDEO_ID_PATTERN.fullmatch(url):
+        return url
+
+    # Common shapes (watch?v=<id>, youtu.be/<id>) need no URL parsing.
+    for marker in VIDEO_URL_MARKERS:
+        start = url.find(marker)
+        if start >= 0:
+            start += len(marker)
+            candidate = url[start:start + 11]
+            if VIDEO_ID_PATTERN.fullmatch(candidate):
+                return candidate
+
     parsed = urlparse(url)
 
     if parsed.netloc.endswith("youtu.be"):
@@ -45,9 +209,13 @@ def extract_video_id(url: str) -> str:
         if VIDEO_ID_PATTERN.fullmatch(candidate or ""):
             return candidate
 
-    query_id = parse_qs(parsed.query).get("v", [""])[0]
-    if VIDEO_ID_PATTERN.fullmatch(query_id):
-        return query_id
+    # First non-empty v= wins, as with parse_qs, which drops blank values.
+    for pair in parsed.query.split("&"):
+        if pair.startswith("v=") and len(pair) > 2:
+            query_id = unquote(pair[2:])
+            if VIDEO_ID_PATTERN.fullmatch(query_id):
+                return query_id
+            break
 
     path_parts = [part for part in parsed.path.split("/") if part]
     if len(path_parts) >= 2 and path_parts[0] in {"watch", "live", "shorts"}:
@@ -55,7 +223,7 @@ def extract_video_id(url: str) -> str:
         if VIDEO_ID_PATTERN.fullmatch(candidate):
             return candidate
 
-    match = VIDEO_ID_PATTERN.search(url)
+    match = VIDEO_ID_SEARCH_PATTERN.search(url)
     if match:
         return match.group(0)
 
@@ -65,10 +233,7 @@ def extract_video_id(url: str) -> str:
 def parse_language_preferences(raw: Optional[str]) -> Optional[List[str]]:
     if not raw:
         return None
-    languages = [code.strip() for code in raw.split(",") if code.strip()]
-    if not languages:
-        return None
-    return languages
+    return [code for code in map(str.strip, raw.split(",")) if code] or None
 
 
 def collect_available_languages(transcripts) -> List[str]:
@@ -82,59 +247,263 @@ def pick_transcript(transcript_list, languages: Optional[List[str]], fallback_co
         except NoTranscriptFound:
             pass
     if not fallback_codes:
-        raise NoTranscriptFound("No subtitles published for this video.")
+        # No transcripts at all: let the list report what was requested and found.
+        raise NoTranscriptFound(transcript_list.video_id, languages or [], transcript_list)
     return transcript_list.find_transcript(fallback_codes)
 
 
+def translation_targets(transcript) -> set:
+    return {lang.language_code for lang in transcript.translation_languages or []}
+
+
+def fetch_cache_key(transcript, translate_to: Optional[str], preserve_formatting: bool) -> str:
+    """Build the cache key for the snippets fetched from `transcript`."""
+    kind = "generated" if transcript.is_generated else "manual"
+    formatting = "formatted" if preserve_formatting else "plain"
+    return f"{transcript.language_code}.{kind}.{translate_to or 'original'}.{formatting}"
+
+
+def load_cached_transcript_data(
+    cache: TranscriptCache,
+    video_id: str,
+    languages: Optional[List[str]],
+    translate_to: Optional[str],
+    preserve_formatting: bool,
+):
+    """Answer fetch_transcript_data from the cache alone, or return None on any miss."""
+    transcript_list = cache.load_transcript_list(video_id)
+    if transcript_list is None:
+        return None
+    available_codes = collect_available_languages(transcript_list)
+    try:
+        transcript = pick_transcript(transcript_list, languages, available_codes)
+    except NoTranscriptFound:
+        return None
+    if translate_to and translate_to not in translation_targets(transcript):
+        return None
+
+    fetched = cache.load_fetched(
+        video_id, fetch_cache_key(transcript, translate_to, preserve_formatting)
+    )
+    if fetched is None:
+        return None
+    return fetched, fetched.language_code, available_codes
+
+
 def fetch_transcript_data(
     api: YouTubeTranscriptApi,
     video_id: str,
     languages: Optional[List[str]],
     translate_to: Optional[str],
     preserve_formatting: bool,
+    cache: Optional[TranscriptCache] = None,
 ):
-    transcript_list = api.list(video_id)
-    transcripts = list(transcript_list)
-    if not transcripts:
-        raise NoTranscriptFound("This video does not expose any transcripts.")
+    if cache is not None:
+        cached = load_cached_transcript_data(
+            cache, video_id, languages, translate_to, preserve_formatting
+        )
+        if cached is not None:
+            return cached
 
-    available_codes = collect_available_languages(transcripts)
+    transcript_list = api.list(video_id)
+    if cache is not None:
+        cache.store_transcript_list(video_id, transcript_list)
+    available_codes = collect_available_languages(transcript_list)
     transcript = pick_transcript(transcript_list, languages, available_codes)
+    cache_key = fetch_cache_key(transcript, translate_to, preserve_formatting)
 
     if translate_to:
-        if not transcript.is_translatable:
-            raise NoTranscriptFound("This transcript cannot be translated.")
-        supported_translations = {
-            lang["language_code"] for lang in transcript.translation_languages or []
-        }
-        if supported_translations and translate_to not in supported_translations:
-            raise NoTranscriptFound(
-                f"Transcript cannot be translated to '{translate_to}'. "
-                f"Available targets: {', '.join(sorted(supported_translations))}"
-            )
+        # The list's description names the available translation languages.
+        if translate_to not in translation_targets(transcript):
+            raise NoTranscriptFound(video_id, [translate_to], transcript_list)
         transcript = transcript.translate(translate_to)
 
     fetched = transcript.fetch(preserve_formatting=preserve_formatting)
+    if cache is not None:
+        cache.store_fetched(video_id, cache_key, fetched)
     return fetched, transcript.language_code, available_codes
 
 
+def thread_api() -> YouTubeTranscriptApi:
+    """Return the API client owned by the current worker thread.
+
+    YouTubeTranscriptApi wraps a requests.Session, which is not thread-safe, so each
+    worker thread keeps its own client and reuses it for every video it handles.
+    """
+    api = getattr(_thread_state, "api", None)
+    if api is None:
+        api = _thread_state.api = YouTubeTranscriptApi()
+    return api
+
+
+def fetch_in_worker(
+    video_id: str,
+    languages: Optional[List[str]],
+    translate_to: Optional[str],
+    preserve_formatting: bool,
+    cache: Optional[TranscriptCache],
+):
+    """Run fetch_transcript_data with the calling thread's API client."""
+    return fetch_transcript_data(
+        api=thread_api(),
+        video_id=video_id,
+        languages=languages,
+        translate_to=translate_to,
+        preserve_formatting=preserve_formatting,
+        cache=cache,
+    )
+
+
+class JsonlSink:
+    """Append one JSON line per video to an open file as soon as its fetch finishes."""
+
+    def __init__(self, handle, format_name: str):
+        self.handle = handle
+        self.format_name = format_name
+        self._lock = asyncio.Lock()
+
+    def _format_line(self, video_id: str, fetched, language: str) -> str:
+        record = {
+            "video_id": video_id,
+            "language": language,
+            "text": format_transcript_text(fetched, self.format_name),
+        }
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+    async def write(self, video_id: str, fetched, language: str) -> None:
+        line = await asyncio.to_thread(self._format_line, video_id, fetched, language)
+        async with self._lock:
+            await asyncio.to_thread(self.handle.write, line)
+
+
+async def fetch_one(
+    video_id: str,
+    languages: Optional[List[str]],
+    translate_to: Optional[str],
+    preserve_formatting: bool,
+    cache: Optional[TranscriptCache],
+    semaphore: asyncio.Semaphore,
+    sink: Optional[JsonlSink] = None,
+):
+    """Fetch a single video, returning the result tuple or the exception it raised.
+
+    With a `sink` the transcript is written out immediately and not kept in the result.
+    """
+    async with semaphore:
+        try:
+            fetched, selected_language, available_codes = await asyncio.to_thread(
+                fetch_in_worker, video_id, languages, translate_to, preserve_formatting, cache
+            )
+            if sink is not None:
+                await sink.write(video_id, fetched, selected_language)
+                fetched = None
+        except Exception as error:
+            return error
+        return video_id, fetched, selected_language, available_codes
+
+
+async def fetch_all(
+    urls: List[str],
+    languages: Optional[List[str]],
+    translate_to: Optional[str],
+    preserve_formatting: bool,
+    cache: Optional[TranscriptCache],
+    sink: Optional[JsonlSink] = None,
+) -> list:
+    """Fetch every URL concurrently and return the results in input order.
+
+    URLs pointing at the same video share a single fetch; URLs without a video id
+    yield their ValueError.
+    """
+    video_ids = []
+    for url in urls:
+        try:
+            video_ids.append(extract_video_id(url))
+        except ValueError as error:
+            video_ids.append(error)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    unique_ids = dict.fromkeys(vid for vid in video_ids if isinstance(vid, str))
+    async with asyncio.TaskGroup() as group:
+        tasks = {
+            vid: group.create_task(
+                fetch_one(
+                    vid, languages, translate_to, preserve_formatting, cache, semaphore, sink
+                )
+            )
+            for vid in unique_ids
+        }
+    return [tasks[vid].result() if isinstance(vid, str) else vid for vid in video_ids]
+
+
 def format_transcript_text(fetched, format_name: str) -> str:
-    formatter_cls = FORMATTERS[format_name]
-    formatter = formatter_cls()
     extra_kwargs = {"indent": 2} if format_name == "json" else {}
-    return formatter.format_transcript(fetched, **extra_kwargs)
+    return FORMATTERS[format_name].format_transcript(fetched, **extra_kwargs)
+
+
+def write_transcript(fetched, format_name: str, output_path: Path) -> None:
+    """Write the transcript to disk, streaming snippets for the text and json formats.
+
+    srt, vtt and pretty need the whole transcript for their framing, so they still go
+    through format_transcript_text.
+    """
+    with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as handle:
+        if format_name == "text":
+            separator = ""
+            for snippet in fetched:
+                handle.write(separator)
+                handle.write(snippet.text)
+                separator = "\n"
+        elif format_name == "json":
+            json.dump(fetched.to_raw_data(), handle, indent=2)
+        else:
+            handle.write(format_transcript_text(fetched, format_name))
+
+
+def resolve_output_path(output: str, video_id: str, batch: bool) -> Path:
+    """Return the file to write; batch runs get one file per video next to `output`."""
+    output_path = Path(output)
+    if batch:
+        output_path = output_path.with_name(f"{output_path.stem}_{video_id}{output_path.suffix}")
+    return output_path
+
+
+def report_error(error: Exception) -> int:
+    """Print the message for a failed download and return the matching exit code."""
+    if isinstance(error, ValueError):
+        print(f"Invalid URL: {error}")
+        return 1
+    if isinstance(error, TranscriptsDisabled):
+        print("Subtitles are disabled for this video.")
+        return 2
+    if isinstance(error, NoTranscriptFound):
+        print(f"No subtitles available: {error}")
+        return 3
+    if isinstance(error, VideoUnavailable):
+        print("Video is unavailable.")
+        return 4
+    print(f"Unexpected error while downloading subtitles: {error}")
+    return 5
 
 
 def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Detect and download YouTube subtitles using youtube-transcript-api."
     )
-    parser.add_argument("url", help="Full YouTube video URL.")
+    parser.add_argument(
+        "urls",
+        nargs="+",
+        metavar="url",
+        help="One or more full YouTube video URLs; several URLs are fetched concurrently.",
+    )
     parser.add_argument(
         "-o",
         "--output",
         default="captions.txt",
-        help="Where to save the formatted transcript (default: captions.txt).",
+        help=(
+            "Where to save the formatted transcript (default: captions.txt). "
+            "With several URLs the video id is appended to the file name."
+        ),
     )
     parser.add_argument(
         "-l",
@@ -156,52 +525,87 @@ def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Keep HTML formatting markers when fetching the transcript.",
     )
+    parser.add_argument(
+        "--jsonl",
+        metavar="OUT.jsonl",
+        help=(
+            "Append one JSON line per video ({video_id, language, text}) to this file "
+            "instead of writing one file per video. Lines are written as each video "
+            "finishes, so they follow completion order, not input order."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not read or write the transcript cache in {DEFAULT_CACHE_DIR}.",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        help=f"Seconds before cached transcripts expire (default: {DEFAULT_CACHE_TTL}).",
+    )
     return parser.parse_args(argv)
 
 
+def report_results(
+    args: argparse.Namespace, results: list, jsonl_path: Optional[Path] = None
+) -> int:
+    """Save and describe each result in input order; return the first failure's code.
+
+    With `jsonl_path` the transcripts were already appended there by the fetch tasks.
+    """
+    batch = len(args.urls) > 1
+    exit_code = 0
+
+    for url, result in zip(args.urls, results):
+        if batch:
+            print(f"[{url}]")
+        if isinstance(result, Exception):
+            error_code = report_error(result)
+            exit_code = exit_code or error_code
+            continue
+
+        video_id, fetched, selected_language, available_languages = result
+        if jsonl_path is not None:
+            output_path = jsonl_path
+        else:
+            output_path = resolve_output_path(args.output, video_id, batch)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            write_transcript(fetched, args.format, output_path)
+
+        print("Subtitles detected!")
+        print(f"Available languages: {', '.join(available_languages)}")
+        if args.translate:
+            print(f"Downloaded language (translated): {args.translate}")
+        else:
+            print(f"Downloaded language: {selected_language}")
+        print(f"Saved to: {output_path}")
+        print(f"Format: {args.format}")
+    return exit_code
+
+
 def main(argv: Optional[Iterable[str]] = None) -> int:
     args = parse_args(argv)
     languages = parse_language_preferences(args.languages)
-    api = YouTubeTranscriptApi()
+    cache = None if args.no_cache else TranscriptCache(DEFAULT_CACHE_DIR, args.cache_ttl)
 
-    try:
-        fetched, selected_language, available_languages = fetch_transcript_data(
-            api=api,
-            video_id=extract_video_id(args.url),
-            languages=languages,
-            translate_to=args.translate,
-            preserve_formatting=args.preserve_formatting,
+    if not args.jsonl:
+        results = asyncio.run(
+            fetch_all(args.urls, languages, args.translate, args.preserve_formatting, cache)
         )
-        formatted_text = format_transcript_text(fetched, args.format)
-    except ValueError as error:
-        print(f"Invalid URL: {error}")
-        return 1
-    except TranscriptsDisabled:
-        print("Subtitles are disabled for this video.")
-        return 2
-    except NoTranscriptFound as error:
-        print(f"No subtitles available: {error}")
-        return 3
-    except VideoUnavailable:
-        print("Video is unavailable.")
-        return 4
-    except Exception as error:
-        print(f"Unexpected error while downloading subtitles: {error}")
-        return 5
-
-    output_path = Path(args.output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(formatted_text, encoding="utf-8")
-
-    print("Subtitles detected!")
-    print(f"Available languages: {', '.join(available_languages)}")
-    if args.translate:
-        print(f"Downloaded language (translated): {args.translate}")
-    else:
-        print(f"Downloaded language: {selected_language}")
-    print(f"Saved to: {output_path}")
-    print(f"Format: {args.format}")
-    return 0
+        return report_results(args, results)
+
+    jsonl_path = Path(args.jsonl)
+    jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(jsonl_path, "a", encoding="utf-8", buffering=JSONL_BUFFER_SIZE) as jsonl_file:
+        sink = JsonlSink(jsonl_file, args.format)
+        results = asyncio.run(
+            fetch_all(
+                args.urls, languages, args.translate, args.preserve_formatting, cache, sink
+            )
+        )
+    return report_results(args, results, jsonl_path)
 
 
 if __name__ == "__main__":
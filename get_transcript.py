@@ -1,74 +1,92 @@
 import re
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, unquote
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
+from youtube_transcript_api.formatters import TextFormatter
+
+# 有安裝 google-re2 時用它做 URL 搜尋（線性時間），否則退回標準 re
+try:
+    import re2 as search_re
+except ImportError:
+    search_re = re
+
+VIDEO_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{11}")
+VIDEO_URL_MARKERS = ("watch?v=", "youtu.be/")
+VIDEO_URL_PATTERN = search_re.compile(
+    r"(?:youtu\.be/|youtube\.com/(?:watch\?v=|live/|shorts/))([A-Za-z0-9_-]{11})"
+)
+
+# 共用同一個 API (與其 requests.Session)，連續抓取多部影片時可沿用連線
+_API = YouTubeTranscriptApi()
+_TEXT_FORMATTER = TextFormatter()
 
 def extract_video_id(url: str) -> str:
+    # 直接傳入 11 碼 video_id 時不必解析 URL
+    if len(url) == 11 and VIDEO_ID_PATTERN.fullmatch(url):
+        return url
+
+    # 常見格式 watch?v={id}、youtu.be/{id} 直接從字串擷取
+    for marker in VIDEO_URL_MARKERS:
+        start = url.find(marker)
+        if start >= 0:
+            start += len(marker)
+            candidate = url[start:start + 11]
+            if VIDEO_ID_PATTERN.fullmatch(candidate):
+                return candidate
+
     parsed = urlparse(url)
-    qs = parse_qs(parsed.query)
-    if "v" in qs and qs["v"]:
-        vid = qs["v"][0]
-        if re.fullmatch(r"[A-Za-z0-9_-]{11}", vid):
-            return vid
+    # 只找第一個非空的 v= 參數 (與 parse_qs 相同)，不必把整個 query 解析成 dict
+    for pair in parsed.query.split("&"):
+        if pair.startswith("v=") and len(pair) > 2:
+            vid = unquote(pair[2:])
+            if VIDEO_ID_PATTERN.fullmatch(vid):
+                return vid
+            break
 
     path_parts = [p for p in parsed.path.split("/") if p]
     # youtu.be/{id}
     if parsed.netloc.endswith("youtu.be") and path_parts:
         cand = path_parts[0]
-        if re.fullmatch(r"[A-Za-z0-9_-]{11}", cand):
+        if VIDEO_ID_PATTERN.fullmatch(cand):
             return cand
 
     # youtube.com/live/{id} 或 youtube.com/shorts/{id}
     if len(path_parts) >= 2 and path_parts[0] in ("live", "shorts"):
         cand = path_parts[1]
-        if re.fullmatch(r"[A-Za-z0-9_-]{11}", cand):
+        if VIDEO_ID_PATTERN.fullmatch(cand):
             return cand
 
     # 最後用 regex 搜尋
-    m = re.search(
-        r"(?:youtu\.be/|youtube\.com/(?:watch\?v=|live/|shorts/))([A-Za-z0-9_-]{11})",
-        url
-    )
+    m = VIDEO_URL_PATTERN.search(url)
     if m:
         return m.group(1)
 
     raise ValueError("無法從提供的連結中抓取到有效的 video_id，請確認 URL 格式。")
 
-def get_transcript_text(video_id: str, languages=("en")) -> str:
-    api = YouTubeTranscriptApi()
-    transcripts_list = None
-    try:
-        transcripts_list = api.list(video_id)
-    except Exception as e:
-        raise Exception(f"無法獲取字幕列表: {e}")
-
-    # 1. 嘗試指定語言的字幕
-    for lang in languages:
-        try:
-            transcript = transcripts_list.find_transcript([lang])
-            caption_data = transcript.fetch()
-            return "\n".join(item["text"] for item in caption_data)
-        except Exception:
-            pass
-
-    # 2. 嘗試獲取任何可用的字幕並自動翻譯成繁體中文
-    try:
-        # 嘗試尋找任何原始字幕，然後翻譯成繁體中文
-        transcript = transcripts_list.find_transcript([]) # 尋找任何原始字幕
-        caption_data = transcript.translate("zh-Hant").fetch()
-        return "\n".join(item["text"] for item in caption_data)
-    except Exception:
-        pass
+def get_transcript_text(video_id: str, languages=("en",), api: YouTubeTranscriptApi = _API) -> str:
+    # 取得列表失敗 (TranscriptsDisabled、VideoUnavailable、網路錯誤等) 直接往外拋，由呼叫端處理
+    transcripts_list = api.list(video_id)
 
-    # 3. 如果以上都失敗，嘗試直接獲取任何可用的原始字幕 (不翻譯)
+    # 1. 依偏好順序嘗試指定語言的字幕（find_transcript 會依序比對）
     try:
-        transcript = transcripts_list.find_transcript([]) # 尋找任何原始字幕
-        caption_data = transcript.fetch()
-        return "\n".join(item["text"] for item in caption_data)
-    except Exception:
+        transcript = transcripts_list.find_transcript(list(languages))
+    except NoTranscriptFound:
         pass
+    else:
+        return _TEXT_FORMATTER.format_transcript(transcript.fetch())
 
+    # 2. 單次掃描所有字幕：優先選可自動翻譯成繁體中文的字幕，否則用第一個原始字幕 (不翻譯)
+    fallback = None
+    for transcript in transcripts_list:
+        if any(lang.language_code == "zh-Hant" for lang in transcript.translation_languages):
+            fallback = transcript.translate("zh-Hant")
+            break
+        if fallback is None:
+            fallback = transcript
 
-    raise Exception("找不到符合需求的字幕，或該影片沒有公開/可取得的字幕。")
+    if fallback is None:
+        # 該影片沒有任何公開/可取得的字幕
+        raise NoTranscriptFound(video_id, list(languages), transcripts_list)
+    return _TEXT_FORMATTER.format_transcript(fallback.fetch())
 
 
 def main():
@@ -99,7 +117,7 @@ def main():
         print(f"擷取字幕時發生錯誤：{e}")
         return
 
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+    with open(OUTPUT_FILE, "w", encoding="utf-8", buffering=64 * 1024) as f:
         f.write(txt)
     print(f"字幕擷取完成：{OUTPUT_FILE}")
 